@@ -2,7 +2,6 @@ import os
 import json
 import re
 import shutil
-import random
 import logging
 import requests
 from crawl4ai import AsyncWebCrawler
@@ -11,6 +10,7 @@ from crawl4ai.async_configs import CrawlerRunConfig, BrowserConfig, CacheMode
 from crawl4ai.content_filter_strategy import PruningContentFilter
 from crawl4ai.markdown_generation_strategy import DefaultMarkdownGenerator
 from utils.queue import UniqueQueue
+from utils.page_store import PageStore
 
 __all__ = ["Crawler"]
 
@@ -30,6 +30,7 @@ class Crawler:
         clean: bool = True,
         remove_tags: None | list[str] = ["form", "nav", "header"],
         cache: bool = False,
+        compress: bool = False,
     ):
         self._url = url
         self._media = media
@@ -40,7 +41,10 @@ class Crawler:
         self._media_path = "media"
         self._remove_tags = remove_tags
         self._cache = cache
-        
+        self.store = PageStore(
+            base_path=os.path.join(self._base_data_path, self._pages_path), compress=compress
+        )
+
         # Only while all media types are not implemented yet
         self._media_warn = False
 
@@ -70,7 +74,8 @@ class Crawler:
         self.browser_config = BrowserConfig(verbose=self.verbose)
         self.crawler_config = CrawlerRunConfig(**crawler_ops)
         self.queue = UniqueQueue()
-        self.queue.add(url)
+        self._seen_keys: set[str] = set()
+        self._enqueue(url)
 
     @staticmethod
     def __parse_markdown(
@@ -105,7 +110,8 @@ class Crawler:
     def _save_file(self, response: CrawlResult) -> dict:
 
         """
-        Saves the result file from the crawl on a markdown file inside data folder.
+        Saves the result file from the crawl on the page store inside data folder. Files are keyed by the
+        normalized URL of the page, so pages sharing the same title do not overwrite each other.
 
         Args:
             response (CrawlResult): The result of the crawl
@@ -118,19 +124,13 @@ class Crawler:
         _title = metadata.get("title")
         _description = metadata.get("description")
 
-        title = f"unnamed_file_{random.randint(0, 1000)}" if not _title else _title
+        title = response.url if not _title else _title
         description = title if not _description else _description
 
         title = re.sub(r"[^a-zA-Z0-9]", "", title)
-        filename = "_".join(title.lower().strip().split()) + ".md"
-        path = os.path.join(self._base_data_path, self._pages_path)
-
-        os.makedirs(path, exist_ok=True)
-
-        path_file = os.path.join(path, filename)
 
         file_metadata = {
-            "path": path_file,
+            "path": self.store.path(response.url),
             "url": response.url,
             "title": title,
             "description": description,
@@ -140,10 +140,10 @@ class Crawler:
         mkdwn: str = self.__parse_markdown(result=response, fit=self._fit_markdown)
 
         if mkdwn:
-            with open(path_file, "w") as f:
-                f.write(mkdwn)
+            self.store.write(response.url, mkdwn)
 
         return file_metadata
+
     def _update_links_queue(self, links: None | dict):
         """
         Updates the Queue with the next links to crawl
@@ -165,8 +165,24 @@ class Crawler:
             if not url or not isinstance(url, str):
                 continue
 
-            url = url.split("#")[0]
-            self.queue.add(url)
+            self._enqueue(url)
+
+    def _enqueue(self, url: str):
+        """
+        Adds an URL to the Queue, skipping it when another URL with the same normalized form (and therefore the
+        same page store key) was already queued, e.g. `http://x.com/a/` and `http://x.com/a`.
+
+        Args:
+            url (str): URL to crawl
+        """
+        url = url.split("#")[0]
+        key = self.store.key(url)
+
+        if key in self._seen_keys:
+            return
+
+        self._seen_keys.add(key)
+        self.queue.add(url)
 
     def _save_media(self, media: dict | list[dict], page_name: str):
         """
@@ -1,10 +1,12 @@
 import os
 import json
 import logging
+from typing import Iterator
 from langgraph.graph import StateGraph, START, END
 from langgraph.types import Send
 from langchain_openai import ChatOpenAI
 from utils.queue import UniqueQueue
+from utils.page_store import PageStore
 from states.loader import LoaderState, GarbageCollectorStructure, RewriterStructure
 from loader.vector_store import VectorStore
 from prompts.loader import GARBAGE_COLLECTOR_PROMPT, REWRITER_PROMPT
@@ -42,10 +44,30 @@ class DocumentLoader:
         return queue
 
 
+    @staticmethod
+    def read_documents(documents: list[dict]) -> Iterator[tuple[dict, str]]:
+        """
+        Reads the content of several documents at once from the page store, in path order and with readahead
+        hints, instead of one `open()` per document in queue order. Documents pointing to an already read path
+        are skipped, so each page is yielded only once.
+
+        Args:
+            documents (list[dict]): documents metadata, each one with its `path`
+
+        Yields:
+            tuple[dict, str]: document metadata and its content
+        """
+        by_path: dict[str, dict] = {}
+        for document in documents:
+            by_path.setdefault(document["path"], document)
+
+        for path, content in PageStore.read_many(list(by_path.keys())):
+            yield by_path[path], content
+
     def manager_node(self, state: LoaderState):
         """
         """
-        send_statement = []
+        documents = []
         for _ in range(len(self.all_documents)):
             if not self.all_documents.empty():
                 document = self.all_documents.pop()
@@ -53,11 +75,12 @@ class DocumentLoader:
                 if not isinstance(document, dict):
                     raise ValueError(f"Document expected type dict, got {type(document)} instead")
 
-                _metadata = {key: value for key, value in document.items() if key in ["url", "title", "description"]}
-                with open(document["path"], "r") as file:
-                    doc = file.read()
+                documents.append(document)
 
-                send_statement.append(Send("garbage_collector", {"document": doc, "metadata": _metadata}))
+        send_statement = []
+        for document, doc in self.read_documents(documents):
+            _metadata = {key: value for key, value in document.items() if key in ["url", "title", "description"]}
+            send_statement.append(Send("garbage_collector", {"document": doc, "metadata": _metadata}))
 
         return send_statement
 
@@ -0,0 +1,207 @@
+import os
+import gzip
+import hashlib
+import tempfile
+from collections import deque
+from typing import Iterator
+from urllib.parse import urlsplit, urlunsplit
+
+__all__ = ["PageStore", "normalize_url"]
+
+
+def normalize_url(url: str) -> str:
+    """
+    Normalizes an URL so the same page always maps to the same key. Scheme and host are lowercased, the fragment
+    is dropped, default ports are removed and the trailing slash of the path is ignored.
+
+    Args:
+        url (str): URL to normalize
+
+    Returns:
+        str: normalized URL
+    """
+    parts = urlsplit(url.strip())
+
+    scheme = parts.scheme.lower()
+    netloc = parts.netloc.lower()
+
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+
+    if (scheme, port) in (("http", 80), ("https", 443)):
+        netloc = netloc.rsplit(":", 1)[0]
+
+    path = parts.path.rstrip("/") or "/"
+
+    return urlunsplit((scheme, netloc, path, parts.query, ""))
+
+
+class PageStore:
+    """
+    Content-addressed store for crawled pages.
+
+    Each page is keyed by a hash of its normalized URL and saved on a sharded folder structure
+    (`<base>/<ab>/<cd>/<key>.md`), so pages never overwrite each other and no single folder grows too large.
+    Pages can optionally be gzip compressed, and every write is atomic.
+    """
+
+    EXTENSION = ".md"
+    COMPRESSED_EXTENSION = ".md.gz"
+    READAHEAD_WINDOW = 8
+
+    def __init__(self, base_path: str, compress: bool = False, shard_depth: int = 2, shard_width: int = 2):
+        self._base_path = base_path
+        self._compress = compress
+        self._shard_depth = shard_depth
+        self._shard_width = shard_width
+
+    @staticmethod
+    def key(url: str) -> str:
+        """
+        Builds the key of a page from its URL.
+
+        Args:
+            url (str): URL of the page
+
+        Returns:
+            str: hex digest of the normalized URL
+        """
+        return hashlib.sha256(normalize_url(url).encode("utf-8")).hexdigest()
+
+    def path(self, url: str) -> str:
+        """
+        Returns the path where the page from the given URL is (or would be) stored.
+
+        Args:
+            url (str): URL of the page
+
+        Returns:
+            str: path of the page file
+        """
+        key = self.key(url)
+        shards = [
+            key[i * self._shard_width:(i + 1) * self._shard_width] for i in range(self._shard_depth)
+        ]
+        extension = self.COMPRESSED_EXTENSION if self._compress else self.EXTENSION
+
+        return os.path.join(self._base_path, *shards, key + extension)
+
+    def write(self, url: str, content: str) -> str:
+        """
+        Atomically writes the content of a page. The content is written to a temporary file on the same folder
+        and then moved to its final path, so readers never see a partially written page. The file gets the same
+        permissions a plain `open(path, "w")` would give it.
+
+        Args:
+            url (str): URL of the page
+            content (str): content of the page
+
+        Returns:
+            str: path of the saved file
+        """
+        path_file = self.path(url)
+        folder = os.path.dirname(path_file)
+
+        os.makedirs(folder, exist_ok=True)
+
+        data = content.encode("utf-8")
+        if self._compress:
+            data = gzip.compress(data)
+
+        fd, tmp_path = tempfile.mkstemp(dir=folder, prefix=".tmp_")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+
+            os.chmod(tmp_path, 0o666 & ~_umask())
+            os.replace(tmp_path, path_file)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        return path_file
+
+    @classmethod
+    def read(cls, path: str) -> str:
+        """
+        Reads a stored page, decompressing it when needed.
+
+        Args:
+            path (str): path of the page file
+
+        Returns:
+            str: content of the page
+        """
+        with open(path, "rb") as f:
+            return cls._decode(path, f.read())
+
+    @classmethod
+    def read_many(cls, paths: list[str]) -> Iterator[tuple[str, str]]:
+        """
+        Reads several pages in path order. Each file is opened only once: the next `READAHEAD_WINDOW` files are
+        kept open ahead of the current one and, when available, the kernel is hinted to prefetch them while the
+        current one is being read.
+
+        Args:
+            paths (list[str]): paths of the page files
+
+        Yields:
+            tuple[str, str]: path and content of each page
+        """
+        pending = deque(sorted(set(paths)))
+        window: deque[tuple[str, int]] = deque()
+
+        try:
+            while pending or window:
+                while pending and len(window) < cls.READAHEAD_WINDOW:
+                    path = pending.popleft()
+                    fd = os.open(path, os.O_RDONLY)
+                    window.append((path, fd))
+                    cls._readahead(fd)
+
+                path, fd = window.popleft()
+                with os.fdopen(fd, "rb") as f:
+                    data = f.read()
+
+                yield path, cls._decode(path, data)
+        finally:
+            for _, fd in window:
+                os.close(fd)
+
+    @classmethod
+    def _decode(cls, path: str, data: bytes) -> str:
+        """
+        Decodes the raw bytes of a page file, decompressing them when the file is gzip compressed.
+        """
+        if path.endswith(cls.COMPRESSED_EXTENSION):
+            data = gzip.decompress(data)
+
+        return data.decode("utf-8")
+
+    @staticmethod
+    def _readahead(fd: int):
+        """
+        Hints the kernel that the given file is going to be read soon. No-op on platforms without `posix_fadvise`.
+        """
+        if not hasattr(os, "posix_fadvise"):
+            return
+
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+
+
+def _umask() -> int:
+    """
+    Returns the current process umask.
+    """
+    mask = os.umask(0)
+    os.umask(mask)
+
+    return mask